@@ -7,13 +7,16 @@ The client:
 3. Plays the requested number of rounds
 """
 
+import selectors
 import socket
 import struct
+import sys
 import time
 from constants import (
-    UDP_BROADCAST_PORT, TCP_TIMEOUT, UDP_TIMEOUT,
+    UDP_BROADCAST_PORT, TCP_TIMEOUT, UDP_TIMEOUT, OFFER_LISTEN_TIMEOUT,
     RESULT_WIN, RESULT_LOSS, RESULT_TIE, RESULT_ROUND_NOT_OVER,
-    TEAM_NAME, get_card_value
+    TEAM_NAME, CARD_VALUES,
+    GREEN, YELLOW, CYAN, RED, RESET, BOLD, make_box
 )
 from protocol import (
     unpack_offer, pack_request, pack_client_payload,
@@ -21,6 +24,13 @@ from protocol import (
 )
 
 
+# Accepted user inputs for each prompt choice
+_HIT_INPUTS = frozenset(('h', 'hit'))
+_STAND_INPUTS = frozenset(('s', 'stand'))
+_QUIT_INPUTS = frozenset(('q', 'quit', 'exit'))
+_PLAY_INPUTS = frozenset(('p', 'play', ''))
+
+
 class BlackjackClient:
     """
     Client class that connects to a server and plays Blackjack.
@@ -36,6 +46,12 @@ class BlackjackClient:
         self.team_name = team_name
         self.running = False
         
+        # Buffered reader over the current game's TCP socket
+        self._reader = None
+        
+        # Round output waiting to be written to the terminal in one go
+        self._output = []
+        
         # Game statistics
         self.total_wins = 0
         self.total_losses = 0
@@ -44,7 +60,8 @@ class BlackjackClient:
     def listen_for_offers(self):
         """
         Listen for UDP offer broadcasts from servers.
-        Also actively sends discovery requests to find servers.
+        Discovery is passive: the protocol has no client probe message,
+        so the client waits for the first valid offer on any interface.
         
         Returns:
             tuple: (server_ip, tcp_port, server_name) or None if timeout
@@ -60,17 +77,25 @@ class BlackjackClient:
         # Enable broadcast receiving and sending
         udp_socket.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
         
+        selector = selectors.DefaultSelector()
+        
         try:
-            # Bind to all interfaces on the broadcast port
+            # Bind to all interfaces on the broadcast port - one socket receives
+            # offers arriving on every network interface at once
             udp_socket.bind(('0.0.0.0', UDP_BROADCAST_PORT))
-            udp_socket.settimeout(1.0)  # Short timeout for active scanning
             
             print("Client started, listening for offer requests...")
             
-            max_attempts = 60  # Try for about 60 seconds
-            attempts = 0
+            # Wait for readability with the platform's best poller (epoll/kqueue/select)
+            # so an expired budget returns no events instead of raising socket.timeout
+            selector.register(udp_socket, selectors.EVENT_READ)
+            deadline = time.monotonic() + OFFER_LISTEN_TIMEOUT
             
-            while attempts < max_attempts:
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not selector.select(timeout=remaining):
+                    break
+                
                 try:
                     data, server_addr = udp_socket.recvfrom(1024)
                     
@@ -88,9 +113,6 @@ class BlackjackClient:
                     print(f"Received offer from {server_ip} (Server: {server_name})")
                     return (server_ip, tcp_port, server_name)
                     
-                except socket.timeout:
-                    attempts += 1
-                    continue
                 except Exception as e:
                     # Ignore any malformed packets
                     continue
@@ -103,44 +125,83 @@ class BlackjackClient:
             print(f"[!] Error listening for offers: {e}")
             return None
         finally:
+            selector.close()
             udp_socket.close()
         
         return None
     
-    def receive_card(self, tcp_socket):
+    def _print(self, text=""):
         """
-        Receive a card from the server.
+        Queue a line of round output until the next flush.
+        
+        Args:
+            text: Line to print
+        """
+        self._output.append(text)
+    
+    def _flush_output(self):
+        """
+        Write all queued output with a single write and flush.
+        """
+        if self._output:
+            sys.stdout.write('\n'.join(self._output) + '\n')
+            self._output.clear()
+        sys.stdout.flush()
+    
+    def receive_cards(self, tcp_socket, count):
+        """
+        Receive several consecutive cards from the server in one read.
         
         Args:
             tcp_socket: TCP socket connected to the server
+            count: Number of payloads to receive
         
         Returns:
-            tuple: (result, rank, suit) or None if error
+            list: (result, rank, suit) tuples or None if error
         """
         try:
             # No timeout - wait for server as long as needed
-            data = tcp_socket.recv(SERVER_PAYLOAD_SIZE)
+            size = count * SERVER_PAYLOAD_SIZE
+            data = self._reader.read(size)
             if not data:
-                print("[!] Server disconnected")
+                self._print("[!] Server disconnected")
                 return None
             
-            if len(data) < SERVER_PAYLOAD_SIZE:
-                print(f"[!] Incomplete data received: {len(data)} bytes")
+            if len(data) < size:
+                self._print(f"[!] Incomplete data received: {len(data)} bytes")
                 return None
             
-            payload = unpack_server_payload(data)
-            if payload is None:
-                print("[!] Invalid payload from server")
-                return None
+            payloads = []
+            for offset in range(0, len(data), SERVER_PAYLOAD_SIZE):
+                payload = unpack_server_payload(data, offset)
+                if payload is None:
+                    self._print("[!] Invalid payload from server")
+                    return None
+                payloads.append(payload)
             
-            return payload
+            return payloads
             
         except ConnectionResetError:
-            print("[!] Connection reset by server")
+            self._print("[!] Connection reset by server")
             return None
         except Exception as e:
-            print(f"[!] Error receiving card: {e}")
+            self._print(f"[!] Error receiving card: {e}")
+            return None
+    
+    def receive_card(self, tcp_socket):
+        """
+        Receive a card from the server.
+        
+        Args:
+            tcp_socket: TCP socket connected to the server
+        
+        Returns:
+            tuple: (result, rank, suit) or None if error
+        """
+        payloads = self.receive_cards(tcp_socket, 1)
+        if payloads is None:
             return None
+        return payloads[0]
     
     def send_action(self, tcp_socket, action):
         """
@@ -150,8 +211,8 @@ class BlackjackClient:
             tcp_socket: TCP socket connected to the server
             action: "hit" or "stand"
         """
-        payload = pack_client_payload(action)
-        tcp_socket.send(payload)
+        # pack_client_payload returns a prebuilt message; sendall guards against short writes
+        tcp_socket.sendall(pack_client_payload(action))
     
     def get_player_decision(self, player_sum, player_cards):
         """
@@ -165,7 +226,8 @@ class BlackjackClient:
         Returns:
             str: "hit" or "stand"
         """
-        from constants import GREEN, CYAN, YELLOW, RESET
+        # Show the round so far before prompting
+        self._flush_output()
         
         print(f"\n  {YELLOW}Your current sum: {player_sum}{RESET}")
         print(f"  [{GREEN}H{RESET}]it or [{CYAN}S{RESET}]tand? ", end="")
@@ -173,9 +235,9 @@ class BlackjackClient:
         while True:
             try:
                 choice = input().strip().lower()
-                if choice in ['h', 'hit']:
+                if choice in _HIT_INPUTS:
                     return "hit"
-                elif choice in ['s', 'stand']:
+                elif choice in _STAND_INPUTS:
                     return "stand"
                 else:
                     print("  Invalid choice. Enter 'h' or 's': ", end="")
@@ -183,49 +245,63 @@ class BlackjackClient:
                 # In case of automated testing, use simple strategy
                 return "stand" if player_sum >= 17 else "hit"
     
-    def play_round(self, tcp_socket, round_num):
+    def format_round_header(self, round_num):
+        """
+        Build the banner shown at the start of a round.
+        
+        Args:
+            round_num: Round number
+        
+        Returns:
+            str: The rendered round header
+        """
+        header = f"{CYAN}┌{'─' * 38}┐{RESET}"
+        title = f"ROUND {round_num}".center(38)
+        title_line = f"{CYAN}│{RESET}{YELLOW}{BOLD}{title}{RESET}{CYAN}│{RESET}"
+        footer = f"{CYAN}└{'─' * 38}┘{RESET}"
+        return f"\n{header}\n{title_line}\n{footer}"
+    
+    def play_round(self, tcp_socket, round_num, round_header=None):
         """
         Play a single round of Blackjack.
         
         Args:
             tcp_socket: TCP socket connected to the server
             round_num: Current round number
+            round_header: Pre-rendered round header (built if not given)
         
         Returns:
             str: "win", "loss", "tie" or None if error
         """
-        from constants import GREEN, YELLOW, CYAN, RED, RESET, BOLD, make_box, pad_line
-        
         # Simple round header
-        header = f"{CYAN}┌{'─' * 38}┐{RESET}"
-        title = f"ROUND {round_num}".center(38)
-        title_line = f"{CYAN}│{RESET}{YELLOW}{BOLD}{title}{RESET}{CYAN}│{RESET}"
-        footer = f"{CYAN}└{'─' * 38}┘{RESET}"
-        print(f"\n{header}\n{title_line}\n{footer}")
+        if round_header is None:
+            round_header = self.format_round_header(round_num)
+        self._print(round_header)
         
         player_cards = []
         dealer_visible_cards = []
         
-        # Receive initial 2 player cards
-        for i in range(2):
-            payload = self.receive_card(tcp_socket)
-            if payload is None:
-                return None
-            result, rank, suit = payload
-            player_cards.append((rank, suit))
-            print(f"  You received: {card_to_string(rank, suit)}")
+        # Running totals, updated as each card arrives
+        player_sum = 0
+        dealer_sum = 0
         
-        # Receive dealer's visible card
-        payload = self.receive_card(tcp_socket)
-        if payload is None:
+        # Receive initial 2 player cards and the dealer's visible card together
+        payloads = self.receive_cards(tcp_socket, 3)
+        if payloads is None:
             return None
-        result, rank, suit = payload
+        
+        for result, rank, suit in payloads[:2]:
+            player_cards.append((rank, suit))
+            player_sum += CARD_VALUES[rank]
+            self._print(f"  You received: {card_to_string(rank, suit)}")
+        
+        # Dealer's visible card
+        result, rank, suit = payloads[2]
         dealer_visible_cards.append((rank, suit))
-        print(f"\n  Dealer shows: {card_to_string(rank, suit)}")
+        dealer_sum += CARD_VALUES[rank]
+        self._print(f"\n  Dealer shows: {card_to_string(rank, suit)}")
         
-        # Calculate initial sum
-        player_sum = sum(get_card_value(r) for r, s in player_cards)
-        print(f"  Your sum: {YELLOW}{player_sum}{RESET}")
+        self._print(f"  Your sum: {YELLOW}{player_sum}{RESET}")
         
         # Player's turn
         while player_sum < 21:
@@ -233,12 +309,11 @@ class BlackjackClient:
             self.send_action(tcp_socket, action)
             
             if action == "stand":
-                print(f"  You chose to {CYAN}STAND{RESET}")
-                # Receive acknowledgment
-                payload = self.receive_card(tcp_socket)
+                self._print(f"  You chose to {CYAN}STAND{RESET}")
+                # The acknowledgment is consumed with the dealer's cards below
                 break
             else:
-                print(f"  You chose to {GREEN}HIT{RESET}")
+                self._print(f"  You chose to {GREEN}HIT{RESET}")
                 
                 # Receive new card
                 payload = self.receive_card(tcp_socket)
@@ -249,35 +324,39 @@ class BlackjackClient:
                 
                 if rank > 0:  # Valid card
                     player_cards.append((rank, suit))
-                    player_sum = sum(get_card_value(r) for r, s in player_cards)
-                    print(f"  You received: {card_to_string(rank, suit)}")
-                    print(f"  Your sum: {YELLOW}{player_sum}{RESET}")
+                    player_sum += CARD_VALUES[rank]
+                    self._print(f"  You received: {card_to_string(rank, suit)}")
+                    self._print(f"  Your sum: {YELLOW}{player_sum}{RESET}")
                 
                 # Check for bust or game end
                 if result == RESULT_LOSS:
-                    print(f"\n  {RED}BUSTED!{RESET}")
+                    self._print(f"\n  {RED}BUSTED!{RESET}")
                     return "loss"
                 elif result == RESULT_WIN:
-                    print(f"\n  {GREEN}YOU WIN!{RESET}")
+                    self._print(f"\n  {GREEN}YOU WIN!{RESET}")
                     return "win"
                 elif result == RESULT_TIE:
-                    print(f"\n  {YELLOW}TIE!{RESET}")
+                    self._print(f"\n  {YELLOW}TIE!{RESET}")
                     return "tie"
         
         # If we get here, player stood or hit 21 - now it's dealer's turn
-        print(f"\n  {CYAN}--- Dealer's Turn ---{RESET}")
+        self._print(f"\n  {CYAN}--- Dealer's Turn ---{RESET}")
         
-        # Receive dealer's hidden card
-        payload = self.receive_card(tcp_socket)
-        if payload is None:
-            return None
-        result, rank, suit = payload
+        # Receive dealer's hidden card, skipping any no-card acknowledgment
+        # the server sends after a stand
+        while True:
+            payload = self.receive_card(tcp_socket)
+            if payload is None:
+                return None
+            result, rank, suit = payload
+            if rank > 0 or result != RESULT_ROUND_NOT_OVER:
+                break
         if rank > 0:
             dealer_visible_cards.append((rank, suit))
-            print(f"  Dealer reveals: {card_to_string(rank, suit)}")
+            dealer_sum += CARD_VALUES[rank]
+            self._print(f"  Dealer reveals: {card_to_string(rank, suit)}")
         
-        dealer_sum = sum(get_card_value(r) for r, s in dealer_visible_cards)
-        print(f"  Dealer's sum: {YELLOW}{dealer_sum}{RESET}")
+        self._print(f"  Dealer's sum: {YELLOW}{dealer_sum}{RESET}")
         
         # Receive dealer's additional cards until result is final
         while result == RESULT_ROUND_NOT_OVER:
@@ -289,19 +368,19 @@ class BlackjackClient:
             
             if rank > 0:  # Valid card
                 dealer_visible_cards.append((rank, suit))
-                dealer_sum = sum(get_card_value(r) for r, s in dealer_visible_cards)
-                print(f"  Dealer draws: {card_to_string(rank, suit)}")
-                print(f"  Dealer's sum: {YELLOW}{dealer_sum}{RESET}")
+                dealer_sum += CARD_VALUES[rank]
+                self._print(f"  Dealer draws: {card_to_string(rank, suit)}")
+                self._print(f"  Dealer's sum: {YELLOW}{dealer_sum}{RESET}")
         
         # Final result
         if result == RESULT_WIN:
-            print(f"\n  {GREEN}YOU WIN! (You: {player_sum} vs Dealer: {dealer_sum}){RESET}")
+            self._print(f"\n  {GREEN}YOU WIN! (You: {player_sum} vs Dealer: {dealer_sum}){RESET}")
             return "win"
         elif result == RESULT_LOSS:
-            print(f"\n  {RED}YOU LOSE! (You: {player_sum} vs Dealer: {dealer_sum}){RESET}")
+            self._print(f"\n  {RED}YOU LOSE! (You: {player_sum} vs Dealer: {dealer_sum}){RESET}")
             return "loss"
         else:
-            print(f"\n  {YELLOW}TIE! (Both have {player_sum}){RESET}")
+            self._print(f"\n  {YELLOW}TIE! (Both have {player_sum}){RESET}")
             return "tie"
     
     def play_game(self, server_ip, tcp_port, server_name, num_rounds):
@@ -324,12 +403,16 @@ class BlackjackClient:
             tcp_socket.settimeout(10.0)  # 10 seconds to connect
             tcp_socket.connect((server_ip, tcp_port))
             tcp_socket.settimeout(None)  # No timeout during game - wait as long as needed
+            # Small request/response messages - send actions immediately (no Nagle delay)
+            tcp_socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            # Buffered reader so several small payloads are served per recv
+            self._reader = tcp_socket.makefile('rb', buffering=65536)
             
             print(f"\n[+] Connected to {server_name} at {server_ip}:{tcp_port}")
             
             # Send request
             request = pack_request(num_rounds, self.team_name)
-            tcp_socket.send(request)
+            tcp_socket.sendall(request)
             
             print(f"[*] Playing {num_rounds} rounds against {server_name}")
             
@@ -338,8 +421,14 @@ class BlackjackClient:
             losses = 0
             ties = 0
             
+            # The number of rounds is known up front, so render all headers once
+            round_headers = [self.format_round_header(i) for i in range(1, num_rounds + 1)]
+            
             for round_num in range(1, num_rounds + 1):
-                result = self.play_round(tcp_socket, round_num)
+                try:
+                    result = self.play_round(tcp_socket, round_num, round_headers[round_num - 1])
+                finally:
+                    self._flush_output()
                 
                 if result is None:
                     print("[!] Game ended unexpectedly")
@@ -359,8 +448,6 @@ class BlackjackClient:
             total = wins + losses + ties
             win_rate = (wins / total * 100) if total > 0 else 0
             
-            from constants import GREEN, YELLOW, CYAN, RED, RESET, BOLD, make_box
-            
             lines = [
                 f"Rounds played: {num_rounds}",
                 f"{GREEN}Wins: {wins}{RESET}  {RED}Losses: {losses}{RESET}  {CYAN}Ties: {ties}{RESET}",
@@ -381,6 +468,9 @@ class BlackjackClient:
             print(f"[!] Error during game: {e}")
             return False
         finally:
+            if self._reader is not None:
+                self._reader.close()
+                self._reader = None
             tcp_socket.close()
     
     def get_menu_choice(self):
@@ -390,8 +480,6 @@ class BlackjackClient:
         Returns:
             tuple: (choice, num_rounds) where choice is 'play' or 'quit'
         """
-        from constants import GREEN, YELLOW, CYAN, RED, RESET, BOLD
-        
         print(f"\n{CYAN}{'─' * 40}{RESET}")
         print(f"  {YELLOW}[P]{RESET} Play again")
         print(f"  {YELLOW}[Q]{RESET} Quit")
@@ -401,9 +489,9 @@ class BlackjackClient:
             try:
                 choice = input(f"  Choose: ").strip().lower()
                 
-                if choice in ['q', 'quit', 'exit']:
+                if choice in _QUIT_INPUTS:
                     return ('quit', 0)
-                elif choice in ['p', 'play', '']:
+                elif choice in _PLAY_INPUTS:
                     # Ask for number of rounds
                     while True:
                         try:
@@ -428,8 +516,6 @@ class BlackjackClient:
         """
         Main client loop - repeatedly listen for offers and play games.
         """
-        from constants import GREEN, YELLOW, CYAN, RED, RESET, BOLD, make_box
-        
         box = make_box(
             "♠ ♥ ♣ ♦  B L A C K J A C K  ♦ ♣ ♥ ♠",
             [f"{CYAN}Team: {self.team_name}{RESET}"],
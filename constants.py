@@ -2,6 +2,8 @@
 Constants for the Blackjack game protocol.
 """
 
+import re
+
 # Network Constants
 UDP_BROADCAST_PORT = 13122  # Port for UDP offer broadcasts
 MAGIC_COOKIE = 0xabcddcba   # Magic cookie for all messages
@@ -41,10 +43,14 @@ CYAN = '\033[96m'
 BOLD = '\033[1m'
 
 
+_ANSI_RE = re.compile(r'\033\[[0-9;]*m')
+
+
 def strip_ansi(text):
     """Remove ANSI color codes from text to get actual display length."""
-    import re
-    return re.sub(r'\033\[[0-9;]*m', '', text)
+    if '\033' not in text:
+        return text  # Plain text, nothing to strip
+    return _ANSI_RE.sub('', text)
 
 
 def pad_line(content, width, border_color, border_char='║'):
@@ -60,9 +66,10 @@ def pad_line(content, width, border_color, border_char='║'):
     Returns:
         Formatted line with borders
     """
-    visible_len = len(strip_ansi(content))
-    padding = width - visible_len
-    return f"{border_color}{border_char}{RESET}{content}{' ' * padding}{border_color}{border_char}{RESET}"
+    # Pad by the visible length only, since ANSI codes take no screen space
+    padding = width - len(strip_ansi(content)) + len(content)
+    border = f"{border_color}{border_char}{RESET}"
+    return f"{border}{content:<{padding}}{border}"
 
 
 def make_box(title, lines, width=40, title_color=YELLOW, border_color=GREEN):
@@ -98,15 +105,19 @@ RANK_NAMES = {
     8: '8', 9: '9', 10: '10', 11: 'J', 12: 'Q', 13: 'K'
 }
 
-# Card Values for Blackjack
+# Card Values for Blackjack, indexed by rank (index 0 is unused)
+# Ace = 11, Face cards (J, Q, K) = 10, Number cards = their value
+CARD_VALUES = (0, 11, 2, 3, 4, 5, 6, 7, 8, 9, 10, 10, 10, 10)
+
+
 def get_card_value(rank):
     """
     Get the blackjack value of a card.
     Ace = 11, Face cards (J, Q, K) = 10, Number cards = their value.
     """
-    if rank == 1:  # Ace
-        return 11
-    elif rank >= 11:  # J, Q, K
+    if 0 <= rank <= 13:
+        return CARD_VALUES[rank]
+    elif rank > 13:  # Out of range, count like a face card
         return 10
     else:
         return rank
@@ -115,6 +126,7 @@ def get_card_value(rank):
 OFFER_INTERVAL = 1.0        # Seconds between UDP broadcasts
 TCP_TIMEOUT = 30.0          # Timeout for TCP operations (30 seconds for player input)
 UDP_TIMEOUT = 10.0          # Timeout for UDP receive
+OFFER_LISTEN_TIMEOUT = 60.0 # Total time the client waits for an offer
 
 # Team Name
 TEAM_NAME = "Byte the Dealer"
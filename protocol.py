@@ -4,16 +4,20 @@ Handles encoding and decoding of all message types.
 """
 
 import struct
+from functools import lru_cache
 from constants import (
     MAGIC_COOKIE, MSG_TYPE_OFFER, MSG_TYPE_REQUEST, MSG_TYPE_PAYLOAD,
-    NAME_LENGTH, ACTION_HIT, ACTION_STAND, RANK_NAMES, SUITS
+    NAME_LENGTH, ACTION_HIT, ACTION_STAND, RANK_NAMES, SUITS,
+    SUIT_SYMBOLS, RED, WHITE, RESET
 )
 
 
+@lru_cache(maxsize=64)
 def pad_name(name):
     """
     Pad or truncate a name to exactly NAME_LENGTH bytes.
     Shorter names are padded with null bytes, longer names are truncated.
+    Results are cached since the same team names are packed repeatedly.
     """
     name_bytes = name.encode('utf-8')[:NAME_LENGTH]
     return name_bytes.ljust(NAME_LENGTH, b'\x00')
@@ -22,14 +26,19 @@ def pad_name(name):
 def unpad_name(name_bytes):
     """
     Remove null byte padding from a name.
+    The name ends at the first null byte, or fills all NAME_LENGTH bytes.
     """
-    return name_bytes.rstrip(b'\x00').decode('utf-8', errors='ignore')
+    end = name_bytes.find(b'\x00')
+    if end == -1:
+        end = NAME_LENGTH
+    return name_bytes[:end].decode('utf-8', errors='ignore')
 
 
 # ============== OFFER MESSAGE ==============
 # Format: Magic (4) + Type (1) + TCP Port (2) + Server Name (32) = 39 bytes
 OFFER_FORMAT = '>I B H 32s'
-OFFER_SIZE = struct.calcsize(OFFER_FORMAT)
+_OFFER = struct.Struct(OFFER_FORMAT)
+OFFER_SIZE = _OFFER.size
 
 
 def pack_offer(tcp_port, server_name):
@@ -43,8 +52,7 @@ def pack_offer(tcp_port, server_name):
     Returns:
         bytes: The packed offer message
     """
-    return struct.pack(
-        OFFER_FORMAT,
+    return _OFFER.pack(
         MAGIC_COOKIE,
         MSG_TYPE_OFFER,
         tcp_port,
@@ -66,7 +74,7 @@ def unpack_offer(data):
         return None
     
     try:
-        magic, msg_type, tcp_port, name_bytes = struct.unpack(OFFER_FORMAT, data[:OFFER_SIZE])
+        magic, msg_type, tcp_port, name_bytes = _OFFER.unpack_from(data, 0)
         
         if magic != MAGIC_COOKIE:
             return None
@@ -81,7 +89,8 @@ def unpack_offer(data):
 # ============== REQUEST MESSAGE ==============
 # Format: Magic (4) + Type (1) + Rounds (1) + Client Name (32) = 38 bytes
 REQUEST_FORMAT = '>I B B 32s'
-REQUEST_SIZE = struct.calcsize(REQUEST_FORMAT)
+_REQUEST = struct.Struct(REQUEST_FORMAT)
+REQUEST_SIZE = _REQUEST.size
 
 
 def pack_request(num_rounds, client_name):
@@ -95,8 +104,7 @@ def pack_request(num_rounds, client_name):
     Returns:
         bytes: The packed request message
     """
-    return struct.pack(
-        REQUEST_FORMAT,
+    return _REQUEST.pack(
         MAGIC_COOKIE,
         MSG_TYPE_REQUEST,
         num_rounds,
@@ -109,7 +117,7 @@ def unpack_request(data):
     Unpack a request message received via TCP.
     
     Args:
-        data: Raw bytes received
+        data: Raw bytes received (any bytes-like object)
     
     Returns:
         tuple: (num_rounds, client_name) or None if invalid
@@ -118,7 +126,7 @@ def unpack_request(data):
         return None
     
     try:
-        magic, msg_type, num_rounds, name_bytes = struct.unpack(REQUEST_FORMAT, data[:REQUEST_SIZE])
+        magic, msg_type, num_rounds, name_bytes = _REQUEST.unpack_from(data, 0)
         
         if magic != MAGIC_COOKIE:
             return None
@@ -135,10 +143,16 @@ def unpack_request(data):
 # Server format: Magic (4) + Type (1) + Result (1) + Card (3) = 9 bytes
 
 CLIENT_PAYLOAD_FORMAT = '>I B 5s'
-CLIENT_PAYLOAD_SIZE = struct.calcsize(CLIENT_PAYLOAD_FORMAT)
+_CLIENT_PAYLOAD = struct.Struct(CLIENT_PAYLOAD_FORMAT)
+CLIENT_PAYLOAD_SIZE = _CLIENT_PAYLOAD.size
 
 SERVER_PAYLOAD_FORMAT = '>I B B 2s 1s'
-SERVER_PAYLOAD_SIZE = struct.calcsize(SERVER_PAYLOAD_FORMAT)
+_SERVER_PAYLOAD = struct.Struct(SERVER_PAYLOAD_FORMAT)
+SERVER_PAYLOAD_SIZE = _SERVER_PAYLOAD.size
+
+# The client only ever sends one of these two messages, so pack them once
+_HIT_PAYLOAD = _CLIENT_PAYLOAD.pack(MAGIC_COOKIE, MSG_TYPE_PAYLOAD, ACTION_HIT)
+_STAND_PAYLOAD = _CLIENT_PAYLOAD.pack(MAGIC_COOKIE, MSG_TYPE_PAYLOAD, ACTION_STAND)
 
 
 def pack_client_payload(action):
@@ -151,13 +165,7 @@ def pack_client_payload(action):
     Returns:
         bytes: The packed payload message
     """
-    action_bytes = ACTION_HIT if action.lower() == "hit" else ACTION_STAND
-    return struct.pack(
-        CLIENT_PAYLOAD_FORMAT,
-        MAGIC_COOKIE,
-        MSG_TYPE_PAYLOAD,
-        action_bytes
-    )
+    return _HIT_PAYLOAD if action.lower() == "hit" else _STAND_PAYLOAD
 
 
 def unpack_client_payload(data):
@@ -165,7 +173,7 @@ def unpack_client_payload(data):
     Unpack a client payload message.
     
     Args:
-        data: Raw bytes received
+        data: Raw bytes received (any bytes-like object)
     
     Returns:
         str: "hit" or "stand" or None if invalid
@@ -174,7 +182,7 @@ def unpack_client_payload(data):
         return None
     
     try:
-        magic, msg_type, action_bytes = struct.unpack(CLIENT_PAYLOAD_FORMAT, data[:CLIENT_PAYLOAD_SIZE])
+        magic, msg_type, action_bytes = _CLIENT_PAYLOAD.unpack_from(data, 0)
         
         if magic != MAGIC_COOKIE:
             return None
@@ -212,8 +220,7 @@ def pack_server_payload(result, card_rank, card_suit):
     else:
         suit_char = card_suit.encode('ascii')
     
-    return struct.pack(
-        SERVER_PAYLOAD_FORMAT,
+    return _SERVER_PAYLOAD.pack(
         MAGIC_COOKIE,
         MSG_TYPE_PAYLOAD,
         result,
@@ -222,30 +229,31 @@ def pack_server_payload(result, card_rank, card_suit):
     )
 
 
-def unpack_server_payload(data):
+def unpack_server_payload(data, offset=0):
     """
     Unpack a server payload message.
     
     Args:
         data: Raw bytes received
+        offset: Position of the payload within data
     
     Returns:
         tuple: (result, card_rank, card_suit) or None if invalid
     """
-    if len(data) < SERVER_PAYLOAD_SIZE:
+    if len(data) - offset < SERVER_PAYLOAD_SIZE:
         return None
     
     try:
-        magic, msg_type, result, rank_bytes, suit_byte = struct.unpack(
-            SERVER_PAYLOAD_FORMAT, data[:SERVER_PAYLOAD_SIZE]
-        )
+        magic, msg_type, result, rank_bytes, suit_byte = _SERVER_PAYLOAD.unpack_from(data, offset)
         
         if magic != MAGIC_COOKIE:
             return None
         if msg_type != MSG_TYPE_PAYLOAD:
             return None
         
-        card_rank = int(rank_bytes.decode('ascii'))
+        card_rank = int(rank_bytes)  # int() parses ASCII digits in bytes directly
+        if not 0 <= card_rank <= 13:  # 0 means no card, otherwise Ace..King
+            return None
         card_suit = suit_byte.decode('ascii')
         
         return (result, card_rank, card_suit)
@@ -253,29 +261,49 @@ def unpack_server_payload(data):
         return None
 
 
-def card_to_string(rank, suit):
+def _format_card(rank, suit):
     """
-    Convert a card rank and suit to a visual colored string.
+    Build the visual colored string for a card.
     
     Args:
         rank: Card rank (1-13)
-        suit: Card suit character or index
+        suit: Card suit character
     
     Returns:
         str: Visual card representation with color
     """
-    from constants import SUIT_SYMBOLS, RED, WHITE, RESET, RANK_NAMES, SUITS
-    
-    if isinstance(suit, int):
-        suit = SUITS[suit]
-    
     rank_name = RANK_NAMES.get(rank, str(rank))
     symbol = SUIT_SYMBOLS.get(suit, suit)
     
     # Red for hearts and diamonds, white for clubs and spades
-    if suit in ['H', 'D']:
-        color = RED
-    else:
-        color = WHITE
+    color = RED if suit in ('H', 'D') else WHITE
     
     return f"{color}[{rank_name}{symbol}]{RESET}"
+
+
+# Every card rendered once, keyed by both (rank, suit char) and (rank, suit index)
+_CARD_STRINGS = {}
+for _rank in RANK_NAMES:
+    for _index, _suit in enumerate(SUITS):
+        _CARD_STRINGS[(_rank, _suit)] = _CARD_STRINGS[(_rank, _index)] = _format_card(_rank, _suit)
+del _rank, _index, _suit
+
+
+def card_to_string(rank, suit):
+    """
+    Convert a card rank and suit to a visual colored string.
+    
+    Args:
+        rank: Card rank (1-13)
+        suit: Card suit character or index
+    
+    Returns:
+        str: Visual card representation with color
+    """
+    try:
+        return _CARD_STRINGS[(rank, suit)]
+    except KeyError:
+        # Not a regular card - format it on the fly
+        if isinstance(suit, int):
+            suit = SUITS[suit]
+        return _format_card(rank, suit)
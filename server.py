@@ -7,15 +7,26 @@ The server:
 3. Manages the Blackjack game logic
 """
 
+import argparse
+import concurrent.futures
+import functools
+import logging
+import multiprocessing
+import os
+import signal
 import socket
 import struct
+import sys
 import threading
 import random
-import time
+try:
+    import fcntl
+except ImportError:
+    fcntl = None  # Not available on Windows
 from constants import (
     UDP_BROADCAST_PORT, OFFER_INTERVAL, TCP_TIMEOUT,
     RESULT_WIN, RESULT_LOSS, RESULT_TIE, RESULT_ROUND_NOT_OVER,
-    TEAM_NAME, get_card_value, SUITS, RANK_NAMES
+    TEAM_NAME, CARD_VALUES, SUITS, RANK_NAMES
 )
 from protocol import (
     pack_offer, unpack_request, pack_server_payload,
@@ -23,20 +34,164 @@ from protocol import (
 )
 
 
+# Per-game output; set BJ_LOG_LEVEL=INFO for round summaries only, WARNING for errors only
+logger = logging.getLogger('bj')
+
+# Signals that stop the server; only its main thread handles them
+_STOP_SIGNALS = {signal.SIGINT, signal.SIGTERM}
+
+# All 52 cards: (rank, suit) where rank is 1-13, suit is 0-3
+_ALL_CARDS = tuple((rank, suit) for rank in range(1, 14) for suit in range(4))
+
+# Only Linux load-balances incoming connections across SO_REUSEPORT listeners
+_REUSEPORT_BALANCES = sys.platform.startswith('linux') and hasattr(socket, 'SO_REUSEPORT')
+
+# Maximum number of games played at the same time by one server process
+MAX_CONCURRENT_GAMES = 64
+
+# Seconds stop() waits for each worker process to exit before killing it
+WORKER_STOP_TIMEOUT = 2.0
+
+# Linux ioctl requests for an interface's IPv4 address and netmask
+_SIOCGIFADDR = 0x8915
+_SIOCGIFNETMASK = 0x891b
+
+
+def _get_netmask(ip):
+    """
+    Look up the netmask of the network interface that holds an IP address.
+    
+    Args:
+        ip: IPv4 address of a local interface
+    
+    Returns:
+        bytes: The 4-byte netmask, or None if it could not be determined
+    """
+    if fcntl is None or not sys.platform.startswith('linux'):
+        return None
+    
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+        for _, name in socket.if_nameindex():
+            ifreq = struct.pack('256s', name.encode()[:15])
+            try:
+                if socket.inet_ntoa(fcntl.ioctl(s.fileno(), _SIOCGIFADDR, ifreq)[20:24]) != ip:
+                    continue
+                return fcntl.ioctl(s.fileno(), _SIOCGIFNETMASK, ifreq)[20:24]
+            except OSError:
+                continue  # Interface has no IPv4 address
+    return None
+
+
+def _make_listener(port=0):
+    """
+    Create a TCP socket bound to the given port on all interfaces.
+    
+    Args:
+        port: Port to bind, or 0 for any available port
+    
+    Returns:
+        socket: The bound (not yet listening) TCP socket
+    """
+    tcp_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    tcp_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    try:
+        tcp_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+    except AttributeError:
+        pass  # SO_REUSEPORT not available on this platform
+    tcp_socket.bind(('', port))
+    return tcp_socket
+
+
+def _log_level_from_env():
+    """
+    Read the log level name from the BJ_LOG_LEVEL environment variable.
+    
+    Returns:
+        int: The logging level, DEBUG if unset or not a known level name
+    """
+    name = (os.environ.get('BJ_LOG_LEVEL') or 'DEBUG').upper()
+    level = logging.getLevelName(name)
+    if not isinstance(level, int):
+        print(f"[!] Unknown BJ_LOG_LEVEL '{name}', using DEBUG")
+        return logging.DEBUG
+    return level
+
+
+def _configure_logging(level):
+    """
+    Send log records to stdout as plain messages.
+    
+    Args:
+        level: Lowest logging level to show
+    """
+    logging.basicConfig(level=level, format='%(message)s', stream=sys.stdout)
+
+
+def _block_stop_signals():
+    """
+    Block SIGINT and SIGTERM in the calling thread, so they are handled
+    by the main thread instead.
+    
+    Returns:
+        set: The previous signal mask, or None if not supported on this platform
+    """
+    if not hasattr(signal, 'pthread_sigmask'):
+        return None
+    return signal.pthread_sigmask(signal.SIG_BLOCK, _STOP_SIGNALS)
+
+
+def _worker_main(parent_sockets, tcp_port):
+    """
+    Entry point of an extra (forked) worker process.
+    Accepts games on its own listener sharing the parent's TCP port.
+    Offers are broadcast by the parent only. Logging is inherited from the
+    parent by fork.
+    
+    Args:
+        parent_sockets: The parent's listener and UDP socket, inherited by fork
+        tcp_port: TCP port shared by all workers
+    """
+    # Drop the parent's listener and UDP socket - its queued connections are not ours
+    for sock in parent_sockets:
+        sock.close()
+    
+    server = BlackjackServer(tcp_port=tcp_port, worker=True)
+    server.running = True
+    server.tcp_socket.listen(5)
+    try:
+        server.accept_clients()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+
+
 class Deck:
     """
     Represents a standard 52-card deck.
     """
     
-    def __init__(self):
-        """Initialize and shuffle a new deck."""
+    __slots__ = ('cards', 'min_cards')
+    
+    def __init__(self, min_cards=15):
+        """
+        Initialize and shuffle a new deck.
+        
+        Args:
+            min_cards: Reshuffle before a round once fewer cards than this remain
+        """
+        self.min_cards = min_cards
         self.reset()
     
     def reset(self):
         """Reset and shuffle the deck."""
-        # Create all 52 cards: (rank, suit) where rank is 1-13, suit is 0-3
-        self.cards = [(rank, suit) for rank in range(1, 14) for suit in range(4)]
-        random.shuffle(self.cards)
+        # A full-length sample is a shuffled copy of the shared card tuple
+        self.cards = random.sample(_ALL_CARDS, len(_ALL_CARDS))
+    
+    def reshuffle_if_low(self):
+        """Reset and shuffle the deck if too few cards remain for a round."""
+        if len(self.cards) < self.min_cards:
+            self.reset()
     
     def draw(self):
         """
@@ -55,6 +210,12 @@ class BlackjackGame:
     Handles a single Blackjack game session with a client.
     """
     
+    # One instance per live game - no per-instance __dict__
+    __slots__ = (
+        'client_socket', 'client_address', 'client_name', 'num_rounds', 'deck',
+        '_rxbuf', '_rxmv', 'player_cards', 'dealer_cards', 'player_sum', 'dealer_sum'
+    )
+    
     def __init__(self, client_socket, client_address, client_name, num_rounds):
         """
         Initialize a new game session.
@@ -71,6 +232,10 @@ class BlackjackGame:
         self.num_rounds = num_rounds
         self.deck = Deck()
         
+        # Reusable receive buffer for player actions
+        self._rxbuf = bytearray(1024)
+        self._rxmv = memoryview(self._rxbuf)
+        
         # Game state
         self.player_cards = []
         self.dealer_cards = []
@@ -87,19 +252,7 @@ class BlackjackGame:
         Returns:
             int: Total value of the cards
         """
-        return sum(get_card_value(rank) for rank, suit in cards)
-    
-    def send_card(self, card, result=RESULT_ROUND_NOT_OVER):
-        """
-        Send a card to the client.
-        
-        Args:
-            card: (rank, suit) tuple
-            result: Game result code
-        """
-        rank, suit = card
-        payload = pack_server_payload(result, rank, suit)
-        self.client_socket.send(payload)
+        return sum([CARD_VALUES[card[0]] for card in cards])
     
     def receive_action(self):
         """
@@ -110,15 +263,15 @@ class BlackjackGame:
         """
         try:
             # No timeout - wait for player as long as needed
-            data = self.client_socket.recv(1024)
-            if not data:
+            n = self.client_socket.recv_into(self._rxbuf)
+            if not n:
                 return None
-            return unpack_client_payload(data)
+            return unpack_client_payload(self._rxmv[:n])
         except ConnectionResetError:
-            print(f"  [!] {self.client_name} disconnected")
+            logger.warning("  [!] %s disconnected", self.client_name)
             return None
         except Exception as e:
-            print(f"  [!] Error receiving action: {e}")
+            logger.warning("  [!] Error receiving action: %s", e)
             return None
     
     def play_round(self, round_num):
@@ -131,100 +284,115 @@ class BlackjackGame:
         Returns:
             str: "win", "loss", or "tie"
         """
-        print(f"\n  === Round {round_num} vs {self.client_name} ===")
+        logger.info("\n  === Round %d vs %s ===", round_num, self.client_name)
         
-        # Reset for new round
-        self.deck.reset()
+        # Local aliases for the calls made on every card
+        _send = self.client_socket.sendall
+        _pack = pack_server_payload
+        _draw = self.deck.draw
+        # Card strings are only built when they will be logged
+        debug = logger.isEnabledFor(logging.DEBUG)
+        
+        # Reset for new round - the deck carries over until it runs low
+        self.deck.reshuffle_if_low()
         self.player_cards = []
         self.dealer_cards = []
         
         # Deal initial cards
         # Player gets 2 cards (both visible)
-        card1 = self.deck.draw()
-        card2 = self.deck.draw()
+        card1 = _draw()
+        card2 = _draw()
         self.player_cards = [card1, card2]
         self.player_sum = self.calculate_sum(self.player_cards)
         
         # Dealer gets 2 cards (first visible, second hidden)
-        dealer_card1 = self.deck.draw()
-        dealer_card2 = self.deck.draw()  # Hidden card
+        dealer_card1 = _draw()
+        dealer_card2 = _draw()  # Hidden card
         self.dealer_cards = [dealer_card1, dealer_card2]
         
-        print(f"  Player's cards: {card_to_string(*card1)}, {card_to_string(*card2)} (sum: {self.player_sum})")
-        print(f"  Dealer's visible card: {card_to_string(*dealer_card1)}")
+        if debug:
+            logger.debug("  Player's cards: %s, %s (sum: %d)",
+                         card_to_string(*card1), card_to_string(*card2), self.player_sum)
+            logger.debug("  Dealer's visible card: %s", card_to_string(*dealer_card1))
         
-        # Send initial cards to player
-        self.send_card(card1)
-        self.send_card(card2)
-        # Send dealer's visible card
-        self.send_card(dealer_card1)
+        # Send initial cards to player and dealer's visible card together
+        _send(b"".join([
+            _pack(RESULT_ROUND_NOT_OVER, card1[0], card1[1]),
+            _pack(RESULT_ROUND_NOT_OVER, card2[0], card2[1]),
+            _pack(RESULT_ROUND_NOT_OVER, dealer_card1[0], dealer_card1[1]),
+        ]))
         
         # Player's turn
         while self.player_sum < 21:
             action = self.receive_action()
             
             if action is None:
-                print(f"  [!] Invalid action from {self.client_name}, ending game")
+                logger.warning("  [!] Invalid action from %s, ending game", self.client_name)
                 return None
             
-            print(f"  Player chose: {action}")
+            logger.debug("  Player chose: %s", action)
             
             if action == "stand":
                 # Send acknowledgment with no new card
-                self.send_card((0, 'H'), RESULT_ROUND_NOT_OVER)
+                _send(_pack(RESULT_ROUND_NOT_OVER, 0, 'H'))
                 break
             elif action == "hit":
-                new_card = self.deck.draw()
+                new_card = _draw()
                 self.player_cards.append(new_card)
-                self.player_sum = self.calculate_sum(self.player_cards)
+                self.player_sum += CARD_VALUES[new_card[0]]
                 
-                print(f"  Player drew: {card_to_string(*new_card)} (new sum: {self.player_sum})")
+                if debug:
+                    logger.debug("  Player drew: %s (new sum: %d)", card_to_string(*new_card), self.player_sum)
                 
                 # Check if player busted
                 if self.player_sum > 21:
-                    print(f"  Player BUSTED!")
-                    self.send_card(new_card, RESULT_LOSS)
+                    logger.info("  Player BUSTED!")
+                    _send(_pack(RESULT_LOSS, new_card[0], new_card[1]))
                     return "loss"
                 else:
-                    self.send_card(new_card, RESULT_ROUND_NOT_OVER)
+                    _send(_pack(RESULT_ROUND_NOT_OVER, new_card[0], new_card[1]))
         
         # Player didn't bust - dealer's turn
-        print(f"\n  Dealer reveals hidden card: {card_to_string(*dealer_card2)}")
+        if debug:
+            logger.debug("\n  Dealer reveals hidden card: %s", card_to_string(*dealer_card2))
         self.dealer_sum = self.calculate_sum(self.dealer_cards)
-        print(f"  Dealer's initial sum: {self.dealer_sum}")
+        logger.debug("  Dealer's initial sum: %d", self.dealer_sum)
         
-        # Send dealer's hidden card
-        self.send_card(dealer_card2)
+        # Dealer's hidden card and every draw are sent together after the loop
+        dealer_payloads = [_pack(RESULT_ROUND_NOT_OVER, dealer_card2[0], dealer_card2[1])]
         
         # Dealer draws until sum >= 17
         while self.dealer_sum < 17:
-            new_card = self.deck.draw()
+            new_card = _draw()
             self.dealer_cards.append(new_card)
-            self.dealer_sum = self.calculate_sum(self.dealer_cards)
+            self.dealer_sum += CARD_VALUES[new_card[0]]
             
-            print(f"  Dealer drew: {card_to_string(*new_card)} (new sum: {self.dealer_sum})")
-            self.send_card(new_card)
+            if debug:
+                logger.debug("  Dealer drew: %s (new sum: %d)", card_to_string(*new_card), self.dealer_sum)
+            dealer_payloads.append(_pack(RESULT_ROUND_NOT_OVER, new_card[0], new_card[1]))
+        
+        _send(b"".join(dealer_payloads))
         
         # Determine winner
         if self.dealer_sum > 21:
-            print(f"  Dealer BUSTED! Player wins!")
+            logger.info("  Dealer BUSTED! Player wins!")
             result = "win"
             result_code = RESULT_WIN
         elif self.player_sum > self.dealer_sum:
-            print(f"  Player wins! ({self.player_sum} vs {self.dealer_sum})")
+            logger.info("  Player wins! (%d vs %d)", self.player_sum, self.dealer_sum)
             result = "win"
             result_code = RESULT_WIN
         elif self.dealer_sum > self.player_sum:
-            print(f"  Dealer wins! ({self.dealer_sum} vs {self.player_sum})")
+            logger.info("  Dealer wins! (%d vs %d)", self.dealer_sum, self.player_sum)
             result = "loss"
             result_code = RESULT_LOSS
         else:
-            print(f"  Tie! ({self.player_sum} vs {self.dealer_sum})")
+            logger.info("  Tie! (%d vs %d)", self.player_sum, self.dealer_sum)
             result = "tie"
             result_code = RESULT_TIE
         
         # Send final result (with dummy card)
-        self.send_card((0, 'H'), result_code)
+        _send(_pack(result_code, 0, 'H'))
         
         return result
     
@@ -232,7 +400,7 @@ class BlackjackGame:
         """
         Run the complete game session.
         """
-        print(f"\n[*] Starting game with {self.client_name} for {self.num_rounds} rounds")
+        logger.info("\n[*] Starting game with %s for %d rounds", self.client_name, self.num_rounds)
         
         wins = 0
         losses = 0
@@ -242,7 +410,7 @@ class BlackjackGame:
             result = self.play_round(round_num)
             
             if result is None:
-                print(f"[!] Game ended unexpectedly")
+                logger.warning("[!] Game ended unexpectedly")
                 break
             
             if result == "win":
@@ -252,8 +420,8 @@ class BlackjackGame:
             else:
                 ties += 1
         
-        print(f"\n[*] Game with {self.client_name} completed!")
-        print(f"    Dealer stats - Wins: {wins}, Losses: {losses}, Ties: {ties}")
+        logger.info("\n[*] Game with %s completed!", self.client_name)
+        logger.info("    Dealer stats - Wins: %d, Losses: %d, Ties: %d", wins, losses, ties)
 
 
 class BlackjackServer:
@@ -261,35 +429,73 @@ class BlackjackServer:
     Main server class that handles UDP broadcasts and TCP connections.
     """
     
-    def __init__(self, team_name=TEAM_NAME):
+    def __init__(self, team_name=TEAM_NAME, tcp_port=0, num_workers=1,
+                 aggressive_discovery=False, worker=False):
         """
         Initialize the server.
         
         Args:
             team_name: Name of the server team
+            tcp_port: TCP port to listen on, or 0 for any available port
+            num_workers: Number of processes accepting games on the TCP port
+            aggressive_discovery: Also unicast offers to common hotspot client IPs
+            worker: Only accept games, without broadcasting offers
         """
         self.team_name = team_name
         self.running = False
+        self.worker = worker
+        self.num_workers = num_workers
+        self.aggressive_discovery = aggressive_discovery
+        self.workers = []
+        
+        # Games run on a bounded pool of reusable threads
+        self.pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers=MAX_CONCURRENT_GAMES,
+            thread_name_prefix='bjgame',
+            initializer=_block_stop_signals
+        )
+        self.active_clients = set()
+        self.clients_lock = threading.Lock()
+        
+        # Set on stop() to wake the broadcast thread immediately
+        self._stop_evt = threading.Event()
         
         # Create TCP socket
-        self.tcp_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        self.tcp_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-        try:
-            self.tcp_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
-        except AttributeError:
-            pass  # SO_REUSEPORT not available on this platform
-        self.tcp_socket.bind(('', 0))  # Bind to any available port
+        self.tcp_socket = _make_listener(tcp_port)
         self.tcp_port = self.tcp_socket.getsockname()[1]
+        # Return from accept() regularly, so the main thread notices signals
+        # even when another thread was interrupted by them
+        self.tcp_socket.settimeout(1.0)
+        
+        self.udp_socket = None
+        if worker:
+            return
         
         # Create UDP socket for broadcasts
         self.udp_socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
         self.udp_socket.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
         self.udp_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        
+        # Local IP, offer and destinations are fixed for the server's lifetime
+        self._local_ip = self._detect_local_ip()
+        self.broadcast_addresses = self.get_broadcast_addresses()
+        self._broadcast_addrs = [(addr, UDP_BROADCAST_PORT) for addr in self.broadcast_addresses]
+        self._offer_bytes = pack_offer(self.tcp_port, self.team_name)
     
     def get_local_ip(self):
         """
         Get the local IP address of this machine.
         
+        Returns:
+            str: Local IP address
+        """
+        return self._local_ip
+    
+    def _detect_local_ip(self):
+        """
+        Find the local IP address of the interface holding the default route.
+        Only called once, when the server is created.
+        
         Returns:
             str: Local IP address
         """
@@ -310,19 +516,23 @@ class BlackjackServer:
         Returns:
             list: List of broadcast addresses
         """
-        addresses = ['<broadcast>', '255.255.255.255']
+        addresses = ['<broadcast>']  # Same as 255.255.255.255
         
         # Calculate subnet broadcast address from local IP
         local_ip = self.get_local_ip()
         if local_ip != "127.0.0.1":
-            # Assume /24 subnet (255.255.255.0) - most common
-            parts = local_ip.split('.')
-            if len(parts) == 4:
-                subnet_broadcast = f"{parts[0]}.{parts[1]}.{parts[2]}.255"
-                addresses.append(subnet_broadcast)
-                
+            ip_bytes = socket.inet_aton(local_ip)
+            # Fall back to a /24 subnet (255.255.255.0) - most common
+            netmask = _get_netmask(local_ip) or b'\xff\xff\xff\x00'
+            ip_value = int.from_bytes(ip_bytes, 'big')
+            mask_value = int.from_bytes(netmask, 'big')
+            broadcast = (ip_value | ~mask_value) & 0xFFFFFFFF
+            addresses.append(socket.inet_ntoa(broadcast.to_bytes(4, 'big')))
+            
+            if self.aggressive_discovery:
                 # For hotspots that block broadcast, also send to common IP ranges
                 # Most hotspots use .1-.20 range for clients
+                parts = local_ip.split('.')
                 for i in range(1, 30):
                     addresses.append(f"{parts[0]}.{parts[1]}.{parts[2]}.{i}")
         
@@ -333,23 +543,27 @@ class BlackjackServer:
         Continuously broadcast UDP offer messages.
         Runs in a separate thread.
         """
-        offer_message = pack_offer(self.tcp_port, self.team_name)
-        broadcast_addresses = self.get_broadcast_addresses()
+        _block_stop_signals()
         
-        print(f"[*] Broadcasting to: {broadcast_addresses}")
+        sendto = self.udp_socket.sendto
+        offer_message = self._offer_bytes
+        broadcast_addrs = self._broadcast_addrs
         
-        while self.running:
+        print(f"[*] Broadcasting to: {self.broadcast_addresses}")
+        
+        while not self._stop_evt.is_set():
             try:
                 # Broadcast to multiple addresses for better compatibility
-                for addr in broadcast_addresses:
+                for addr in broadcast_addrs:
                     try:
-                        self.udp_socket.sendto(offer_message, (addr, UDP_BROADCAST_PORT))
+                        sendto(offer_message, addr)
                     except:
                         pass
             except Exception as e:
                 print(f"[!] Error broadcasting offer: {e}")
             
-            time.sleep(OFFER_INTERVAL)
+            # Returns early when the server stops
+            self._stop_evt.wait(OFFER_INTERVAL)
     
     def handle_client(self, client_socket, client_address):
         """
@@ -359,38 +573,44 @@ class BlackjackServer:
             client_socket: TCP socket connected to the client
             client_address: Address of the client
         """
-        print(f"\n[+] New connection from {client_address}")
+        logger.info("\n[+] New connection from %s", client_address)
         
         try:
+            # Small request/response messages - don't let Nagle hold them back
+            client_socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            
             # No global timeout - connection stays open until game ends
             # Individual operations will set their own timeouts as needed
             
             # Receive request message (with timeout for initial request)
             client_socket.settimeout(30.0)  # 30 seconds to send request
-            data = client_socket.recv(1024)
-            if not data:
-                print(f"[-] Empty request from {client_address}")
+            buf = bytearray(1024)
+            n = client_socket.recv_into(buf)
+            if not n:
+                logger.warning("[-] Empty request from %s", client_address)
                 return
             
-            request = unpack_request(data)
+            request = unpack_request(memoryview(buf)[:n])
             if request is None:
-                print(f"[-] Invalid request from {client_address}")
+                logger.warning("[-] Invalid request from %s", client_address)
                 return
             
             num_rounds, client_name = request
-            print(f"[+] {client_name} wants to play {num_rounds} rounds")
+            logger.info("[+] %s wants to play %d rounds", client_name, num_rounds)
             
             # Start the game
             game = BlackjackGame(client_socket, client_address, client_name, num_rounds)
             game.run()
             
         except socket.timeout:
-            print(f"[-] Timeout with client {client_address}")
+            logger.warning("[-] Timeout with client %s", client_address)
         except Exception as e:
-            print(f"[-] Error handling client {client_address}: {e}")
+            logger.warning("[-] Error handling client %s: %s", client_address, e)
         finally:
+            with self.clients_lock:
+                self.active_clients.discard(client_socket)
             client_socket.close()
-            print(f"[-] Connection closed with {client_address}")
+            logger.info("[-] Connection closed with %s", client_address)
     
     def start(self):
         """
@@ -407,50 +627,158 @@ class BlackjackServer:
         print(f"Broadcasting offers on UDP port {UDP_BROADCAST_PORT}")
         print("=" * 50)
         
+        # Start listening for TCP connections
+        self.tcp_socket.listen(5)
+        
+        # Fork extra workers before starting any threads
+        self.start_workers()
+        
         # Start broadcast thread
         broadcast_thread = threading.Thread(target=self.broadcast_offers, daemon=True)
         broadcast_thread.start()
         
-        # Start listening for TCP connections
-        self.tcp_socket.listen(5)
-        
         try:
-            while self.running:
-                try:
-                    client_socket, client_address = self.tcp_socket.accept()
-                    
-                    # Handle each client in a separate thread
-                    client_thread = threading.Thread(
-                        target=self.handle_client,
-                        args=(client_socket, client_address),
-                        daemon=True
-                    )
-                    client_thread.start()
-                    
-                except socket.timeout:
-                    continue
-                    
+            self.accept_clients()
         except KeyboardInterrupt:
             print("\n[!] Server shutting down...")
         finally:
             self.stop()
     
+    def start_workers(self):
+        """
+        Start extra worker processes, each with its own listener on the TCP port.
+        The kernel spreads incoming connections across all listeners' accept queues.
+        """
+        if self.num_workers <= 1 or not _REUSEPORT_BALANCES:
+            return
+        
+        # Exit normally on SIGTERM so the daemon workers are terminated with us
+        if threading.current_thread() is threading.main_thread():
+            signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+        
+        # Fork, so workers can close the sockets they inherit from us
+        ctx = multiprocessing.get_context('fork')
+        for _ in range(self.num_workers - 1):
+            worker = ctx.Process(
+                target=_worker_main,
+                args=((self.tcp_socket, self.udp_socket), self.tcp_port),
+                daemon=True
+            )
+            worker.start()
+            self.workers.append(worker)
+        
+        print(f"[*] {self.num_workers} processes accepting games on TCP port {self.tcp_port}")
+    
+    def accept_clients(self):
+        """
+        Accept TCP connections and start a game for each one.
+        Runs until the server is stopped.
+        """
+        while self.running:
+            try:
+                client_socket, client_address = self.tcp_socket.accept()
+                
+                # Track the socket before queueing it, so stop() can wake it
+                # whether its game is queued or already running
+                with self.clients_lock:
+                    if not self.running:
+                        # stop() has already woken the tracked sockets
+                        client_socket.close()
+                        break
+                    self.active_clients.add(client_socket)
+                
+                # Handle each client on a pooled thread. Games are turn-based and
+                # spend nearly all their time blocked in recv waiting for the player,
+                # which releases the GIL, so blocking threads are kept over an event loop.
+                # Connections beyond MAX_CONCURRENT_GAMES wait for a free thread.
+                future = self.pool.submit(self.handle_client, client_socket, client_address)
+                future.add_done_callback(functools.partial(self._close_if_cancelled, client_socket))
+                
+            except socket.timeout:
+                continue
+    
+    def _close_if_cancelled(self, client_socket, future):
+        """
+        Close the socket of a game cancelled by stop() before it started,
+        since handle_client never runs to close it.
+        
+        Args:
+            client_socket: TCP socket connected to the client
+            future: The game's future from the pool
+        """
+        if future.cancelled():
+            with self.clients_lock:
+                self.active_clients.discard(client_socket)
+            client_socket.close()
+    
     def stop(self):
         """
         Stop the server.
         """
-        self.running = False
-        self.tcp_socket.close()
-        self.udp_socket.close()
-        print("[*] Server stopped")
+        # A signal arriving halfway would leave games blocked in recv,
+        # so hold it back until the server is fully stopped
+        old_mask = _block_stop_signals()
+        try:
+            self.running = False
+            self._stop_evt.set()
+            self.tcp_socket.close()
+            if self.udp_socket is not None:
+                self.udp_socket.close()
+            
+            # Drop queued games and wake running ones blocked in recv, since pool
+            # threads are joined at interpreter exit
+            try:
+                self.pool.shutdown(wait=False, cancel_futures=True)
+            except TypeError:
+                self.pool.shutdown(wait=False)  # Python < 3.9 runs queued games to their first recv
+            with self.clients_lock:
+                for client_socket in self.active_clients:
+                    try:
+                        client_socket.shutdown(socket.SHUT_RDWR)
+                    except OSError:
+                        pass  # Already disconnected
+            
+            self.stop_workers()
+            if not self.worker:
+                print("[*] Server stopped")
+        finally:
+            if old_mask is not None:
+                signal.pthread_sigmask(signal.SIG_SETMASK, old_mask)
+    
+    def stop_workers(self):
+        """
+        Stop the worker processes, killing any that do not exit in time.
+        """
+        for worker in self.workers:
+            worker.terminate()
+        for worker in self.workers:
+            worker.join(WORKER_STOP_TIMEOUT)
+            if worker.is_alive():
+                worker.kill()
+                worker.join()
 
 
 def main():
     """
     Main entry point for the server.
     """
+    parser = argparse.ArgumentParser(description="Blackjack server (dealer)")
+    parser.add_argument(
+        '--aggressive-discovery', action='store_true',
+        help="also unicast offers to .1-.29 on the local subnet, for hotspots that block broadcast"
+    )
+    args = parser.parse_args()
+    
+    # Per-card game output is DEBUG level, shown by default
+    _configure_logging(_log_level_from_env())
+    
     # You can change the team name here or pass it as argument
-    server = BlackjackServer(TEAM_NAME)
+    # One accepting process per core (extra workers are only used on Linux)
+    server = BlackjackServer(
+        TEAM_NAME,
+        num_workers=os.cpu_count() or 1,
+        aggressive_discovery=args.aggressive_discovery
+    )
     server.start()
 
 